@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Bake the default app icon into a Python module.
+
+Writes src/assets/_icon_data.py with the PNG stored as a base64 bytes literal,
+so `truffle init` can write the icon without resolving package resources.
+Re-run whenever src/assets/default_app.png changes.
+"""
+
+import base64
+import textwrap
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "src" / "assets"
+ICON_PATH = ASSETS_DIR / "default_app.png"
+OUTPUT_PATH = ASSETS_DIR / "_icon_data.py"
+
+def main() -> None:
+    """Generate the icon data module."""
+    encoded = base64.b64encode(ICON_PATH.read_bytes()).decode("ascii")
+    lines = "\n".join(f'    b"{chunk}"' for chunk in textwrap.wrap(encoded, 76))
+    OUTPUT_PATH.write_text(
+        "# Auto-generated by scripts/generate_icon_data.py - do not edit\n"
+        "import base64\n"
+        "\n"
+        "ICON_BYTES = base64.b64decode(\n"
+        f"{lines}\n"
+        ")\n"
+    )
+
+if __name__ == "__main__":
+    main()
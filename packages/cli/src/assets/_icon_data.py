@@ -0,0 +1,197 @@
+# Auto-generated by scripts/generate_icon_data.py - do not edit
+import base64
+
+ICON_BYTES = base64.b64decode(
+    b"iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAqcElEQVR4Ae3dWbCV5Zkv8IfBc6Wg"
+    b"mL6RYdOdAclgTleBdLqq7Q4h5KYbo0n6Jk7o6aogoJ7UCWppkkocYtLdlWNETZ1OQA1etDlRSZ+L"
+    b"Vomm01XtANUng1EkEyh604ljbk7LcL5n7bVwgxvYe7PW+qbfr+plLWADunXz/N/nHb5pQS0cPHhw"
+    b"WvEyvRjTxhkjxTi1GGd1X2cXY0H3l44c8QpwLK8W47Uj3j/ffd3T/bE93XFwvDFt2rQDQeVNCyqn"
+    b"KPa9Qj893ir6WcA/2H39QPe1NwDKsGfM+NmY9z8pRoaAg71XoaB6BICSdWf2OWbEW0U/C33O5rPQ"
+    b"nxNvzfAB6iC7BD+N0SDwszHve6Fgf4yGgoNBaQSAEnRn+L0xJ0aL/V/GW4VfsQeaZmwo+D/d9y/H"
+    b"aCg4oEMwfALAEIxZv8+RM/2c1f9Z9/WcAGinHxXjX7uvOTIEZHfggO7A4AkAA9It+lnse7P8v4rR"
+    b"op+vZvgAh8sOQYaA7A78U4x2B4SBARIA+mjMTD8Lfxb9C2O0tW+WDzA5GQa2dF9/U4z9RRDYH/SN"
+    b"ANAH3TX9XtFfVYwLQtEH6JdeGPhOjHYF9tszcOIEgCk6osX/FzE6088Zv/Y+wGDkMkEuD2QY+Jdi"
+    b"7AtLBFMmAEzSEbP9i0KLH6AMed/ATTHaHfh1MfYJApMjAExQt/DPLMYfF+PTYbYPUAW9rkCGgdwr"
+    b"sM/ywMQIAMcxpvD/RTGuC7N9gKr6fjFuj+7ygE2DxyYAHIXCD1BbedlQBoF7QhA4KgHgCAo/QGP0"
+    b"9gkIAuMQALoUfoDG6gWBu8MegUNaHwC6x/lOCoUfoOnyxMCGYvx7ODXQ3gAw5hz/O4vxv0LhB2iL"
+    b"vFAoOwK/itFLhVoZBFoZAIrin4X/HcVY1x2O8wG0z43F2FiM37Zxf0CrAsCYdv/Hi/G1YowEAG3W"
+    b"2x9wV7RsWaA1AaAo/rnBT7sfgPEcWhYoQsC+aIHGB4Axs/4rYnSTn3Y/AOPJWwVzSSCXBv6z6d2A"
+    b"RgcAs34ApiCXBT4WDe8GTI8Gyll/Mf5L8faqYjwRij8AE5f7w3YW44tZS7qd5MZp3L9Ud4f/u8Ks"
+    b"H4ATl3cH/E2MdgMadVKgUR2AovjnWv8nwqwfgP7IWvJwMS7tLis3RiM6AN32TLb8/7YY6wMA+u/G"
+    b"aNAGwdoHgO4d/u8uxj8W44MBAIOTGwRXFuOXdX+mQK2XALrtmBUx2vJX/AEYtNwgmEsCK+q+JFDL"
+    b"ANDd5Z/r/V8sxkPhbD8Aw5MhIGvPF7u1qJZqtwTQXe//g2L8XTEuDAAoz23F+FzUcF9ArQJAt/jn"
+    b"ev99oeUPQDX8pBh/XYxf1CkE1CYAjNnsl20XD/EBoEpqtzmwFnsAupf7LInRzX6KPwBV09scuKRb"
+    b"syqv8gGg+4lcHTb7AVBtvc2Bq+twQqDSSwDdT+AlxfiHAID62FCMr1f5YUKV7QB0i38e81P8Aaib"
+    b"r8XoMcHKdgIq2QEYU/yvDwCor7w6+EtV7ARULgAo/gA0TCVDQKUCgOIPQENVLgRUZg+A4g9Ag2Vt"
+    b"+2KVjghWogPQ/YT89xh9nC8ANNXfFGNz0QnYHyUrPQB0b/i7NOz2B6AdMgRsKvvGwFIDQPdu/6Xh"
+    b"kh8A2uPVYnysGNvLfHZAaQFgzIN98upE1/sC0CYZApZFiQ8QKnMToOIPQFtl1ztr4Lu7E+KhK+UP"
+    b"Lf5lTypetodH+gLQbvko4Y8WXYD/iCEbegege9zv70PxB4CshX9fxpXBQw0A3eN+edZ/fQAA6cIY"
+    b"vSNgqDV5aEsA3TWOTxbjvgAAjpQnAx4Z1qbAYQaA94RNfwBwNEM9GTCUANDd9PeLUPwB4FhyU+CK"
+    b"IgD8NgZs4OsN3XX/3PSn+APAseWmwC8M45kBA+0AdNf9LwvX/ALAZPx1Mf73IJcCBh0A8rKfR8Ls"
+    b"HwAmI/cDnF0EgF/EgAxsCaB7pvFbofgDwGTlTYHfGuT9AAMJAN3Wf573PycAgKnIGnrVoK4KHshv"
+    b"2j3y91wAACdiYEsBfe8AdNsVDwcAcKIGthTQ1wAwpvVv3R8A+mMgSwF9/c26u/53BQDQT31fCuhb"
+    b"B6B7acHfBQDQb72lgL5dENSXANBtS6wuxqoAAAYhlwIu7ddSQF9+k+If5l3Fy7aw9g8Ag5RLAe/u"
+    b"x7MCTrgD0E0iV4TiDwCDlksBfdkQeMK/QXf2P7CrCgGAt3nPiW4IPKEOQFH889d/IQCAYfpWtwZP"
+    b"2Ql1AIo//KPh0h8AKMNHiy7AtpiiKQeA7lGEX4W1fwAow4+K8eEiBByIKTiR9kEe+1P8AaAceSzw"
+    b"IzFFU+oAmP0DQCXsKcY7iy7A/pikqXYAzP4BoHxZi1fHFEy6A2D2DwCVMqUuwFQ6AGb/AFAdWZPP"
+    b"i0maVAfA7B8AKmnSJwIm2wHIhKH4A0C15ImA5ZP5BRMOAN17h9cHAFBFn5/M7YATXgJw5z8AVN6K"
+    b"YhngBxP5wAklhe7s353/AFBtF030SYET+qDiN/ujGN38BwBU16vFeHfRBfjt8T5womsFk9pYAACU"
+    b"4tRiXDmRDzxuB6C7oeDXYfc/ANRBdgFOP96RwIl0AD4cij8A1EV2AY7buT9mAOhuJLg4AIA6WX+8"
+    b"zYDH/Emb/wCglnIZ4F3FMsDvjvYBx1sC+HAAAHWTywCXHOsDjhoAuq2DiwIAqKNVx1oGOOpPaP8D"
+    b"QO2942jLAMdaAtD+B4B6u+RoPzFuAND+B4BGOOoywLg/qP0PAI0x7jLA0ZYAtP8BoBkuGe8HjxYA"
+    b"VgUA0AR/Nd4ywNt+oHv3//4AAJogLwV6Z7EM8PLYHxyvA6D9DwDNkZcC/fGRPzheADg3AIAmeVtt"
+    b"PywAdNcIzgkAoEnOOXIfwGHfcfwPABrrsOOARy4B/NcAAJrosGWAIwPAXwQA0ESHTfIPBQDr/wDQ"
+    b"aIftAzj0pvjBOcXL7wIAaKrTe/cBjF0CsP4PAM12qNYLAADQHuMGAOv/ANBsH+y9GRsAFgYA0GR/"
+    b"3tsI2PnGA4AAoDXmTJs27ZVeB+CDAQC0wR/mN9PHfgcAaLzOpF8HAADaZWF+IwAAQLuM5De9ALAw"
+    b"AIA26NwFML17HGAkAIA2GMnaP6345rTiOy8HANAWc3IJYGEAAG2yMAPAqQEAtMlCHQAAaJ9TMwDY"
+    b"AAgA7TJiCQAA2qfTATgtAIA26QSABQEAtMnI9AAA2maaPQAA0D4jM0MAgEY4ePDgodfe+8mYNm3a"
+    b"uK9AM2UA8FUONdEr7uONl156qfMx+dp7//rrr8cbb7xxzN/zlFNOiVmzZsXJJ5/cec3v5zjjjDM6"
+    b"IaAXBKZPn37Ye6DWOs8CmPxUARiK/fv3H1bkX3zxxdi5c2enwD/33HOd4t77/iBkCMiRwWDRokWd"
+    b"0XufrxkIesFAKIB6EQCgQnoF/8CBA53Z+2OPPdYp8Dl27drV+bGqOPPMMzvhIMPA0qVLD4WCDAK9"
+    b"AVSXAAAl6hX7HK+99tqhgv/oo48ObFY/SBkKlixZ0hkZCmbPnn0oDNhTANUiAEAJcqafRX/v3r2d"
+    b"Yp9jx44d0TQZBM4999xOGJg7d27MmDFDGICKEABgSLLgZ+HPmf7WrVsbW/SPJrsDq1atiuXLl8e8"
+    b"efM6QSADAVAOAQAGLIt+ju3bt8cdd9zRqqJ/NL3OwMc//vFDQUBXAIZLAIAByaL/yiuvxJYtW+Le"
+    b"e++t1Aa+qshNhLk8sGbNmpg/f74gAEMkAECfKfxTkx2BCy64IBYvXnxorwAwOAIA9InC3x+5PHD5"
+    b"5ZfHsmXLdARggAQAOEEK/2BkR8DSAAyOAABTlF86+/btiwceeCDuvPPOWp7br4MMAtkR6AUBoD8E"
+    b"AJiCnPU///zzcf3119vVPwS5WTD3B1x44YVx0kkn6QZAHwgAMAm9Wf/tt9+u3V+CDAKbNm2KBQsW"
+    b"6AbACRIAYILM+qsj9wasXbs2Zs6cqRsAUyQAwATkrP/uu++Ob37zm2b9FZGnBW666aZON8CRQZg8"
+    b"AQCOIb88Xn755c4NfrnLn2rJJYENGzbEypUrLQnAJAkAcBT5pbFnz5648sorO0/oo7pySWDdunWd"
+    b"JQFgYgQAGEeu9z/99NNx1VVXOd5XE3lK4Oqrr3ZKACZIAIAjZPH/3ve+F5///OeDesknDt56660x"
+    b"MjIiBMBxCAAwRhb/2267rXOxD/WU+wI2b94sBMBx2DoLXYp/M+SSzerVqzv7N8xv4OgEAAjFv2mE"
+    b"ADg+AYDWU/ybaWwIAN5OAKDVDhw4EHfddZfi31AZAvIYZ97lABzOJkBaK//Xf+ihhzoFomly81tv"
+    b"A9x4G+HGftnn+6b/NbB8+fLYuHGjy4JgDAGAVupd8vOpT32qtlf7ZmHPK3B7xb5X6GfNmhWnnHJK"
+    b"Zzd86r2ONfZug3yfo/dXQb5mZ6QXDJryV0ReFrR+/XohALpcm0Ur5UN9cn24TsW/V+x7r4sXL473"
+    b"vOc9nbPvWeTz9eSTT+4EgKnIz0UvDOTNh7t27eq8f/bZZw8LBflaR7nMM3fu3PjkJz/peCCEDgAt"
+    b"lJv+Lrroolo80S+LfW8sXbr00MjCP9VCP1kZDDIMPPXUU53P2fbt2w8Fgfxc1kl+zr773e/GwoUL"
+    b"A9pOAKBV8n/3vCmu6pv+sk2dI4t9rl+vWrVqaAX/eDIQZBB49NFH47HHHotXX321Ewbq0hnITkne"
+    b"9Oi5AbSdAECr/PSnP+2s+1dVFv3TTjutc699Fv5FixZF1X3/+9+PBx98sNMZyI5AHboC+fm97rrr"
+    b"PEaYVhMAaI08CvaJT3yikg/3GVv4P/3pT1dmtj8Z+XnNxyZnV+CVV145tGegqvK64D/90z8NaCsB"
+    b"gFbIYnTNNdfE1q1bo0pyBjpnzpxaF/4jZRDIz3N2BV544YXKdgRyKeD+++93KoDWEgBohX/7t3/r"
+    b"7PqvklyDXrZsWdx4443jHtWru15HIMPAvn37KrlHIB8ffOmllwa0kQBA4+UMdMWKFZVp/ecRtNNP"
+    b"P71zLj1n/k2Xn/frr78+nnzyyU4QqJLsuDz88MOd5RdoGztgaLTMt3nPf1WKf7abzzrrrM5RtDYU"
+    b"/5TdjU2bNsW1114b73jHOyp1Bj9PNNx9990eGEQr6QDQaHnhT278q8KFP1n8L7nkktiwYUO0VQax"
+    b"bLnnf5cq7Q145JFHYsGCBQFtogNAY2W2zfvfq1L88xraNhf/lN2Af/7nf+4EoSptvsv/T6BtdABo"
+    b"rJxlfvSjH42y9Yp/rvnzlryMKQtvVfYFPPHEE/YC0Co6ADRSb/ZfNsX/6PJz8pWvfKUyN/LlXgBo"
+    b"Ex0AGqkKs3/Ff2LyJsHcIFh2J8CJANpGB4DGqcLsPy/4UfwnJp9zUIVOQO4VycuLoC0EABpn7969"
+    b"pd74l8fc/uRP/kTxn4QMAdkFKHtj4LZt22r7uGOYLAGAxsnNXGXK42Q33XRTMDl5L0KeDijznoB8"
+    b"ymE+9hjaQACgUXL2ltfPliVnsDfffHMjr/Ydhjwm+YEPfCDKVHaAhGERAGiUvG62rFv/cuaa6/5L"
+    b"liwJpu7WW28tdSNeLh/ZG00bCAA0ygMPPBBlmT9/fueJfpyY7J6sW7eus5GyDBkgn3322YCmEwBo"
+    b"jGz/b9++PcrQO/LXhMf5VkHuB8gnJZYlO0nQdAIAjZGbt8pq/5933nmdnez0T5ldgB/84AcBTScA"
+    b"0Bh5hKsMOftfu3Zt0F+5l6KsLsBzzz0Xr732WkCTCQA0Rlnt/5z92/U/GGV1AfJSoJ07dwY0mQBA"
+    b"I+RsrYy/sM3+B6vMLsAzzzwT0GQCAI1Q1q5ts//BKytgldVRgmERAGiEMm5vy9b0RRddFAzWokWL"
+    b"SrkXwFFAmk4AoBHKaP9nazqLE4OVRys//vGPx7DliRIbAWkyAYBGePHFF2PYzj///GA4PvKRj0QZ"
+    b"yjpWCsMgANAIw/6L+tRTT3Xuf4iy0zJ79uwYNhsBaTIBgNrLe9vz2NYwrVixIhieXAY488wzY9jK"
+    b"6CzBsAgA1N6wZ//50J/c/c9wLV68OIbNEgBNJgDAJM2bN88T/0pQRgdg2J0lGCYBACbp7LPPDoZP"
+    b"BwD6SwCASbL+X44yLlzSAaDJBABqL9fkhyUv/9H+L0duBBz245bfeOONgKYSAKi9nBkOKwTk5T/D"
+    b"LkK85ZRTTolh0gGgyQQAGuG9731vDIPd/+USvqB/BAAaYRgb8/Lyn6VLlwblGXYHAJpMAKARcmPe"
+    b"IJcB8vfOP8OT/4CmEABohNyY9773vS8GZf78+aU9lhZgEAQAGiMLdO7S77cZM2bE+vXrzf4rIK99"
+    b"BvpDAKAxli9fHitXruzrUkAW/0suucSDfyrCxTzQPwIAjXLDDTfEyMhIX0JAFv9PfOITsWHDhqAa"
+    b"hn0u36kDmkwAoFHyL+zNmzfHWWed1SngUwkC+WtOOumkzsw/AwXVUMZTHwUAmkwAoHFyrf6+++7r"
+    b"rNtnN2DmzJkT2huQH5OFf+HChXHXXXeZ+VfMs88+G8Nm3wdNNjOgodasWRPnnntu7NixIx588MHY"
+    b"vn37oU1kvdec7efImd6iRYvi8ssvd9VvRb344osxbMO8ZhqGTQCg0XIGlxv4cmT7eNeuXZ3X3//+"
+    b"952fP/nkkzuPmTXTq75nnnkmhq2MRxDDsAgAtEbO8s3u6ys7OMNmDwBNZg8AUHm5ZPPcc8/FsC1e"
+    b"vDigqQQAoPKy/V/Gk/nmzZsX0FQCAFB527Zti2HLUyG5MRSaSgAAKi3b/48++mgMmyc/0nQCAFBp"
+    b"P//5z2Pnzp0xbO9973sDmkwAACorZ//33HNPlEEHgKYTAIDK2rt3bynH//ICICcAaDoBAKisJ554"
+    b"opQnAGb73+VQNJ0AAFTS/v3744477ogynH322QFNJwAAlZNr/7fddlsps/9s/69YsSKg6QQAoHJe"
+    b"eOGFuPfee6MMefmPK6NpAwEAqJRs/W/cuLGUm//SsmXLAtpAAAAqI1v/999/f2zdujXKkO3/8847"
+    b"L6ANBACgMp5//vnSNv6l+fPna//TGgIAUAnZ+r/llltK2fjXs27duoC2EACA0h04cKCz67+MO/97"
+    b"Tj31VLf/0SoCAFCqXPd/+OGH484774wy5dE/l//QJtMO5lcfQAnyr5+f/exncdlll5W26z/NmDGj"
+    b"88hhAYA20QEASpHFf8+ePXHllVeWWvxT7vxX/GkbHQBg6HrFf/Xq1aVu+ktm/7SVDgAwVFUq/r1z"
+    b"/4o/bSQAAENTpeKf8tz/2rVrA9pIAACGIov/7t27K1P8c/a/fv16s39ayx4AYODykp+f//znpe/2"
+    b"H2vhwoXx0EMPBbSVDgAwUFn8v/e971Wq+OfGv82bNwe02cwAGJB9+/Z1nuxX9iU/Y2n9wyhLAEDf"
+    b"5V8rL7/8cnz1q18t7cl+R6P1D6MEAKCv8l7/3Ol/1VVXxc6dO6NKZs6cGY888ojZP4QlAKCPcr3/"
+    b"iSee6BT/qqz39+S6/7XXXqv4Q5cAAJywbCTmev/tt99eqfX+nlz3v/jii+OCCy4IYJQlAOCEZMv/"
+    b"+eefj+uuuy527NgRVZPFf2RkJL773e/GrFmzAhilAwBMWc76n3zyybj++usrcbnPeLL455E/xR8O"
+    b"JwAAk5aNwzfffLOzy3/Lli1RVXPmzIlbb73Vuj+MQwAAJiU3+mXLv4q7/Mfqbfo788wzA3g7AQCY"
+    b"sJz133PPPfHNb36zcrv8x8rin5f9rFq1KoDxCQDAceVGv7zY58orr6zkRr+xesV/zZo1ARydZwEA"
+    b"x5Qb/R5//PH41Kc+pfhDg+gAAOPqne2/5ZZbKr3Rr0fxh8kRAIC36V3nm8f7qj7rT4o/TJ4AABym"
+    b"ytf5jifv91+3bp3iD5MkAACH5C7/ql7nO54s/nnUzxW/MHkCANBZ7//d735Xi13+Ka/3zUt+rrnm"
+    b"Gkf9YIoEAGi53nr/pZdeWtnrfMfq3e2fN/y55AemTgCAFqvbev/06dM7xX/Tpk2u94UT5B4AaKks"
+    b"/nfddVdn5l+H4p87/T/0oQ/Ffffdp/hDH+gAQAvl+f6NGzfWZrPfSSedFGvXrrXTH/pIAICWyZ3+"
+    b"1113XWzdujWqLtf7Tz/99Ljhhhti+fLlAfSPAAAtkjv9r7jiitpc7vO+973P43xhQAQAaIks/rne"
+    b"X+VH+Pbk+f6LL744PvOZz8SsWbMC6D8BAFrgt7/9bVx22WWVL/65yz/P91999dXO98OACQDQcDnz"
+    b"zyf5Vf2Mf876ly1bFjfeeKOWPwyBAAAN1mv7V7n450a/3OWfs35X+sLwCADQUC+//HLl1/xzo9/7"
+    b"3//++PKXv+xWPxgyAQAaKC/5ueWWWypb/HPWny3/iy66KDZs2BDA8AkA0DBZ/G+77bbKnvPPWf+C"
+    b"BQs6a/1LliwJoBwCADRIPtgni39Vb/jLWf/5558fn/vc5xzvg5IJANAgjz76aGWLfxb8devWdc73"
+    b"A+UTAKAhdu/eHTfddFNUjRv9oJqmHSwEUGu57r9ixYrKHfdzox9Ulw4A1Fxv3b9Kxb/3EB83+kF1"
+    b"6QBAjeWX7+OPPx6rV6+OqsjrfEdGRmLTpk1a/lBh0wOorRdeeKHzaN+qyPX+D33oQ3Hfffcp/lBx"
+    b"lgCgpnL2v3Hjxsq0/nO9P3f5r1mzJoDqswQANZW7/j/2sY9FFeRd/tdcc427/KFGBACooSrt+s/N"
+    b"fnmr3/LlywOoD0sAUEP3339/6cW/t9P/29/+tgf5QA3pAEDNVGH2n8U/d/pv3rzZZj+oKacAoGaq"
+    b"MPtX/KH+dACgRqow+58zZ06n+Gv7Q73pAECNlD37z3P++bwBxR/qTwCAmsgrf++4444oSxb/9evX"
+    b"2+0PDSEAQE08+eSTpc3+c9Pf+eef75IfaBABAGrigQceiLIsWLAgNmzYEEBzCABQA9n+f+yxx6IM"
+    b"2fq/+eabPc4XGkYAgBrYtm1bvP7661GG8847L5YsWRJAswgAUAMZAMpw2mmnxdq1awNoHgEAKi6v"
+    b"6ti+fXuU4eKLL3bZDzSUAAAV98wzz5Sy+z/X/s8999wAmkkAgIp76qmnogy59m/2D80lAEDFldH+"
+    b"z3P/GQCA5hIAoOJefPHFGLZ58+bZ+Q8NJwBAhb322muxc+fOGLZ84BDQbAIAVNhzzz0XZRAAoPkE"
+    b"AKiw7AAM2/Tp07X/oQUEAKiwMtr/S5cuDaD5BACosDfeeCOGbe7cuQE0nwAAFVbGEsDixYsDaD4B"
+    b"ACqsjBsAdQCgHQQA4DACALSDAAAcZtasWQE0nwAAHMb9/9AOAgBwSD4DAGgHAQA4xOwf2kMAAIAW"
+    b"EgAAoIUEAABoIQEAAFpIAACAFhIAAKCFBAAAaCEBACps2BfzuAYY2kMAgAob9sU8AgC0hwAAFTZ7"
+    b"9uwYpsWLFwfQDgIAVNiwC/K8efMCaAcBACrs7LPPHto+gPxz8s8D2kEAgArLPQDz58+PYcjZ/6JF"
+    b"iwJoBwEAKu68886LYVi2bFkA7THtYCGAynr99ddj5cqV8corr8SgzJgxI7Zt2+ZxwNAiOgBQcXk0"
+    b"b926dTF9+mC+XHPtf/369Yo/tIwOANTE6tWr4/HHH49+fslm8R8ZGYmHHnoogHbRAYCauOmmmzrF"
+    b"ul+nAnrFf/PmzQG0jwAANZEt+izWZ511VmfN/kSCQP76hQsXdn4/rX9oJ0sAUEN33nlnPPjgg7F3"
+    b"797Yv3//hJYFMjDkPoIs/hdeeGF85jOfcfUvtJgAADX10ksvxY4dO2LLli3x7LPPdkJAb/T0ugRZ"
+    b"+OfOnRvnnntuZ5j1AwIANEAeFdy1a1fs3Lmz874nZ/g5lixZougDhxEAAKCFbAIEgBYSAACghQQA"
+    b"AGghAQAAWkgAAIAWEgAAoIUEAABoIQEAAFpIAACAFhIAAKCFBAAAaCEBAABaSAAAgBYSAACghQQA"
+    b"AGghAQAAWkgAAIAWEgAAoIUEAABoIQEAAFpIAACAFhIAAKCFBAAAaCEBAABaSAAAgBYSAACghQQA"
+    b"AGghAQAAWkgAAIAWEgAAoIUEAABoIQEAAFpIAACAFhIAAKCFZgZQewcPHowDBw50Xo80bdq0wwZA"
+    b"EgCgprLg79+/v1P0d+7cGdu3b4+XXnop3njjjUMfc8opp3TGokWL4swzz4y5c+fGjBkzYvr06cIA"
+    b"tJwAADWTRT9HFvwtW7bEjh074vXXX5/Qr80Q8OEPfzjOPffcmD9/ficMCALQTtMOjtczBConv1Tf"
+    b"fPPNePDBB+POO+/szPZPRIaANWvWxIIFCzpBAGgXAQBqIGf8Tz/9dHzhC1/otPv7KUPA5ZdfHied"
+    b"dJJuALSIAAAVt2/fvrj77rvja1/7WgzKGWecEZs3b46RkREhAFpCAIAKy+L/la98pbPWP2gZAr7x"
+    b"jW/E+9//fiEAWkAAgIrKtv/NN988lOLfM2vWrNi0aZMQAC3gIiCooDzid9tttw21+Kc8TXDFFVfE"
+    b"nj17Amg2HQComPySfOihh+LKK6+MsuRxwfvvv9/pAGgwHQComBdeeCG++tWvRpnypEF2IMwPoLkE"
+    b"AKiQLLgbN2484TP+/XDvvfd2wgjQTAIAVEgW3K1bt0YV5H6ADCNAMwkAUCFVK7iPPfZYvPLKKwE0"
+    b"jwAAFZE7//N+/yrJLkBePQw0jwAAFfHUU09VYu3/SNu2bQugeQQAqIgnn3wyqiifNvjaa68F0CwC"
+    b"AFRE1dr/Y/X7AURA+QQAqIgXX3wxqmrv3r0BNIsAABVRxfX/niqHE2BqBACogNxtX2VVDifA1AgA"
+    b"UAG///3vo8o8GRCaRwCACjjjjDOiyqr+zwdMngAAFTF79uyoqir/swFTIwBARcybNy+qau7cuQE0"
+    b"iwAAFbF06dKoolz/X7x4cQDNIgBARVS1yGZnwh4AaB4BACpi+fLlMX169b4kly1bFkDzCABQEbNm"
+    b"zapcsc1ActFFFwXQPAIAVMi6desq1QXIQLJo0aIAmkcAgApZsmRJZboAGUTOP//8AJpJAICKyS7A"
+    b"jBkzomwrV66MVatWBdBMAgBUTHYBLrnkklKv350zZ05cffXVATSXAAAVtGHDhvjABz5QSgjI7sO1"
+    b"117r6B80nAAAFXXrrbfGyMjIUENAFv/169dr/UMLCABQUTkD37x589BCwMyZMzvFf82aNQE037SD"
+    b"hQAq66WXXoqrrroqnn766di/f3/0W4aLLP7XXHNNXHDBBQG0gwAANXHnnXfGHXfcEW+++Wb068s2"
+    b"W/4LFiyIG2+8sbP5EGiPDAAH8jWAystuwKWXXhp79+7tdAMOHDgQU5GF/7TTTuvM+D/96U93biEE"
+    b"WuVgBoDfFG8WBlAbO3bsiC1btsQPfvCDTgjIjkDv9UjZ4u+NvNxn9uzZCj+wWwCAGsuOQIaBp556"
+    b"Knbt2hU7d+7s/HgvCGTRz82EZ555ZudK33zksFY/EN0A8OvizR8G0BgZDE4++WQzfOBofjOz+GZP"
+    b"CADQKC7xAY5jT94D4BQAALRMBoDnAwBok1d1AACgfXZnANgdAECbdDoAewIAaJNOB+CVAADaZI8l"
+    b"AABon85VwKcWb14OzwMAgDbIzf9zpk+bNu3V4s2rAQC0watZ+6d3v2MfAAC0w+78phcAfhIAQBvs"
+    b"zm+mj/0OANB4nUm/DgAAtMthAeDHAQC0QWffX+fon6OAANAKB4px+qFTAN2jgL8JAKDJftKt+YeW"
+    b"ANK/BADQZLt7b8YGABsBAaDZDk32xwYAGwEBoNkO1fpDm/5sBASARju0ATC/c6gDYCMgADTaj3vF"
+    b"P00/4ie3BgDQRIct9U8/1k8CAI3x/bHfOTIA5O7AgwEANEmu/x+9A1CsDewJ+wAAoGl+3K3xh0wf"
+    b"54PsAwCAZnnbEv94AeCHAQA0ydsm928789+9D+B3MX44AADq5bDz/z1vK/LdD/hhAABN8NiRxT8d"
+    b"bZZvHwAANMM94/3guNf+FssAI8XLr8MyAADUWbb//+jIEwBp3ALf/cAfBgBQZ/93vOKfjjXD/2EA"
+    b"AHV2z9F+4qhP/rMMAAC1dtT2fzpqcbcMAAC1dtT2fzre7P7BAADq6BvH+slpx/pJlwIBQC0ds/2f"
+    b"jlnYuxcHPBoAQJ08eKzinyYys78hPCIYAOoia/Zxl/CnxQQUSwG/LV5ODwCg6n5dzP7febwPmuja"
+    b"/q0BANTBhJbuJ9oBsBkQAKpvfzHeebz1/zShgm4zIADUwl0TKf5pMjP63Ax4IACAKsrNf/dM9IMn"
+    b"tARw6Hc+eHBb8fKRAACq5pfF7P/dE/3gya7p561CjgQCQLVkbf7yZH7BpDoAnT/h4MFfFi/HPV4A"
+    b"AAzNpGb/aSq7+vNIoC4AAFTDpGf/aSodgDwSmF0AFwMBQPkmPftPk+4AdI8E6gIAQPmmNPtPk+4A"
+    b"dP600S7A9mK8KwCAskxp9p+mdLNftwuQiUMXAADKMeXZf5pSB+DQn3zw4K7iZUrJAwA4IVOe/acT"
+    b"vdv/v4XbAQFg2LL2Tnn2n06oA5CKLsAjxcuKAACGZXsx+z87TkA/AsA5MfqgoBkBAAzahJ/4dywn"
+    b"/Hjf4h/gR8XL5rAhEAAGLWvt5hMt/umEOwCpeyzwF8V4RwAAg/KrYnykHwHghDsAacyxQBsCAWAw"
+    b"cvZ/az+Kf+pLB6DHhkAAGJhdRfFfFH3Slw7AGDfE6OYEAKB/9hVjZfRRXwNAd0Pg/wwbAgGgX7Km"
+    b"fqlfrf+evi4BpO6GwKfCDYEA0A99bf339HsJoLchMG8ItBQAACem763/nr4HgDRmKcCpAACYmoG0"
+    b"/nv6vgTQ010KeLgYSwb55wBAQw2k9d8z0MJchICR4mVHuCAIACYjW//vGtTsPw1kCaCn+w+eFwTZ"
+    b"DwAAE5M187ODLP5pKK35ohNwX/HyybAUAADHkuv+3y6K/9/EgA0rAPSOBr4rhAAAOJpdxVg56Nl/"
+    b"GloxLkLAB4uXbWE/AACMZ+Dr/mMNdA/AWMW/0E/CfgAAGE8W/88Oq/inoQWAVPyL3Va8fD3cDwAA"
+    b"PVkTv9StkUNTynp8sRyQ9wOsCPsBAGi33PS3rSj+A7nt71jKCgC5KfDJGH1egBAAQBtl8f9FDGnT"
+    b"35FKK77dS4LyZMAfhBAAQPtk8f9oGcU/lVp4nQwAoKXeLMbS7gb5Ugx1E+CRuv/in43R3Y8A0AZZ"
+    b"8y4rs/inUgNAKj4B3wkhAIB2yFr3pW7tK1XpASB1jz58KYQAAJqrV/xvjAqo1Oa7gwcPXl+8fLEY"
+    b"MwMAmqNSxT9Vbve9EABAw1Su+KdKHr8TAgBoiEoW/1TZ8/dCAAA1V9ninyp9AY8QAEBNVbr4p8rf"
+    b"wCcEAFAzlS/+qRZX8HZDwBeKcVIAQDXl3f5Z/L9c9eKfanMHfxECLixevhWjIcCzAwCokiz+/1GM"
+    b"/1GFS34molaFtPvsgPvCUwQBqI5e8V9Z9vW+k1G7Itp9iuDDxXhXVOQmQwBa60AxfhklPdL3RNSu"
+    b"gHY/wSuLsSNcHQxAefbH6BNtl9Wt+KdazqDzE12MZeH5AQAMX2+z39eLWvSxYrwaNVT7dfRiSWB9"
+    b"8fK3xfgvYV8AAIPVW++/sfsgu9pqRMEcsy/gncWYEQDQf9ny/1Ux/rpOm/2OphGb6MbsC9gclgQA"
+    b"6K9ey//+GF3vr33xT41rmXcvDcphSQCAE9WYlv+RGlkgu0sCD8XokoArhAGYika1/I/UyHP03VMC"
+    b"Z8boKYH/jNEEBwATkTUja8fXo0Et/yM1vkVedAPOKV7+IWwQBOD4erP+vykK/4+iwRp/k173P2De"
+    b"GZBJ7v+FbgAAb5c3+o2d9Te6+KdWbZI7Ym9AdgNsEgRot5wU5qz/34vxuTYU/p5W3aV/xN6A3NW5"
+    b"PwBoq6wBWQs+m7fLtqn4p9bOgLvdgDwueFF4xDBAm2S7P8/1312Mm+p4j38/tL7odR8x/I/F+KMY"
+    b"PTIoCAA0U+9Cn8ditPC3asZ/JMWuqwgCFxYv14UgANA0vXX+3N2fhf87gSJ3JEEAoDF6hf93xdhY"
+    b"FP4bg0MUt6MQBABq67DCH6PFv5aP7B0kRe04BAGA2sjNfVn4Xw6F/7gUswkaEwT+MEaDQKuOUAJU"
+    b"WG9X/w+LscUa/8QIAJPUvVo4g8Cfx1tBwOcRYLh6bf4c/xJ29U+awjVFY+4R+LMYXR7ImwV1BQAG"
+    b"68g2/3faeo7/RAkAfdBdHrggRrsCM8I1wwD9dCDeKvw527+9GD+yvn9iFKk+6nYFVhVjbYzuFeh1"
+    b"BXyeASan1+LPwv/jYvxT2NTXVwrTgHRvGMyuwF/FaBiYPmYA8HYHxozfFGNLjM70re0PgAAwBN0w"
+    b"kJsH/zJGlwnGhgH/DYC2yln+2KKf7f1/LcY/FUX/J8FAKT5D1l0mOKc7cgNhdgfyv4NAADRdr+D3"
+    b"2vvZzv9+vFX0tfeHSLEpWbc7cFaMLhXk68J4Kwj0Xv13AuqmV+wj3prh7y5GtvN/Vozv271fLoWl"
+    b"Yrodgl4o+LPu+1Pj7YFAMACqYGyhPzjm+zmbz2KfRT5n+HbtV4wCUgNFKMgAkIEgw8CC7vuR7pgW"
+    b"44eCo70CHMvBI96P9/2xIwv8T7uvz3dfFfsaUBRqrggHC2N02aA3MizM7r6PcV4BjuXV7ui93919"
+    b"fW3M+3zdXRT53UFt/X802OB9ZiHbkAAAAABJRU5ErkJggg=="
+)
@@ -11,30 +11,170 @@ This module handles the creation of new Truffle projects. It provides functional
 import typer
 from pathlib import Path
 import json
-import shutil
-import uuid
 import os
-import requests
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, List, Union
+
+if TYPE_CHECKING:
+    import aiohttp
 
 from ..utils.logger import log, Symbols
 from ..utils.templates import (
     
-    generate_main_py,
+    generate_main_py_iter,
     generate_manifest,
     generate_requirements,
-    copy_default_icon
+    get_default_icon_bytes
 )
 from ..config.api_config import OPENAI_API_KEY
 
-def _generate_example_prompts(tool_name: str, description: str) -> List[str]:
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+PROMPT_MODEL = "gpt-3.5-turbo"
+PROMPT_CACHE_FILE = Path("truffle") / "prompts.json"
+
+# Transient statuses worth retrying
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_PROMPT_ATTEMPTS = 5
+
+# Seconds allowed to connect, and between reads of the streamed response
+PROMPT_CONNECT_TIMEOUT = 5
+PROMPT_READ_TIMEOUT = 10
+# Seconds allowed for all attempts and backoff before falling back to defaults
+PROMPT_RETRY_BUDGET = 30
+
+def _prompt_cache_key(tool_name: str, description: str) -> str:
+    """Hash the inputs that determine generated prompts into a cache key."""
+    import hashlib
+    
+    key_source = f"{tool_name}|{description}|{PROMPT_MODEL}".encode("utf-8")
+    return hashlib.blake2b(key_source, digest_size=16).hexdigest()
+
+def _prompt_cache_path() -> Optional[Path]:
+    """
+    Locate the on-disk prompt cache, preferring $XDG_CACHE_HOME.
+    Resolved on use rather than at import so a missing home directory
+    only disables the cache instead of breaking every CLI command.
+    
+    Returns:
+        Path to the cache file, or None if no cache directory can be determined
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home and os.path.isabs(cache_home):
+        return Path(cache_home) / PROMPT_CACHE_FILE
+    try:
+        return Path.home() / ".cache" / PROMPT_CACHE_FILE
+    except (RuntimeError, KeyError):
+        return None
+
+def _load_prompt_cache() -> Dict[str, List[str]]:
+    """
+    Load previously generated prompts from disk.
+    
+    Returns:
+        Mapping of cache key to prompts, empty if the cache is missing or unreadable
+    """
+    cache_path = _prompt_cache_path()
+    if cache_path is None:
+        return {}
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _store_cached_prompts(cache_key: str, prompts: List[str]) -> None:
+    """
+    Persist generated prompts to the on-disk cache.
+    Failures are ignored - the cache is only an optimization.
+    
+    Args:
+        cache_key: Key from _prompt_cache_key
+        prompts: Prompts to store
+    """
+    cache_path = _prompt_cache_path()
+    if cache_path is None:
+        return
+    try:
+        cache = _load_prompt_cache()
+        cache[cache_key] = prompts
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write then rename so concurrent inits never see a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache, ensure_ascii=False))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def _open_openai_session() -> "aiohttp.ClientSession":
+    """
+    Open a pooled session for OpenAI requests.
+    Retries and concurrent prompt generations reuse its keep-alive
+    connections instead of paying a new TCP+TLS handshake each time.
+    
+    Returns:
+        A new aiohttp session (caller must close it)
+    """
+    # Imported lazily - aiohttp is only needed when prompts are generated
+    import aiohttp
+    
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=4),
+        # Per-phase limits suit a streamed reply; overall time is capped by the retry budget
+        timeout=aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=PROMPT_CONNECT_TIMEOUT,
+            sock_read=PROMPT_READ_TIMEOUT
+        ),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {OPENAI_API_KEY}"
+        }
+    )
+
+async def _stream_completion(session: "aiohttp.ClientSession", request_data: Dict[str, Any]) -> str:
+    """
+    Send a streaming chat completion request and assemble the reply.
+    
+    Args:
+        session: Session from _open_openai_session
+        request_data: Chat completion request body (with "stream" enabled)
+        
+    Returns:
+        The concatenated message content
+        
+    Raises:
+        aiohttp.ClientResponseError: If the API returns an error status
+    """
+    async with session.post(OPENAI_CHAT_COMPLETIONS_URL, json=request_data) as response:
+        response.raise_for_status()
+        
+        parts: List[str] = []
+        async for raw_line in response.content:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            delta = json.loads(payload)["choices"][0].get("delta", {})
+            parts.append(delta.get("content") or "")
+        return "".join(parts)
+
+async def _generate_example_prompts_async(
+    tool_name: str,
+    description: str,
+    session: Optional["aiohttp.ClientSession"] = None
+) -> List[str]:
     """
     Generate example prompts using OpenAI API.
-    Fallback to defaults silently if API key is not available.
+    Retries transient failures with backoff and falls back to defaults silently
+    if the API key is not available or all attempts fail.
     
     Args:
         tool_name: Name of the tool
         description: Tool description
+        session: Optional shared session from _open_openai_session; a
+            private one is opened (and closed) when not given
         
     Returns:
         List of generated example prompts
@@ -48,15 +188,20 @@ def _generate_example_prompts(tool_name: str, description: str) -> List[str]:
     ]
 
     try:
+        cache_key = _prompt_cache_key(tool_name, description)
+        cached = _load_prompt_cache().get(cache_key)
+        if isinstance(cached, list) and cached:
+            return cached
+            
         if not OPENAI_API_KEY:
             return default_prompts
             
         request_data = {
-            "model": "gpt-3.5-turbo",
+            "model": PROMPT_MODEL,
             "messages": [
                 {
                     "role": "system",
-                    "content": "Reflect on realistic use cases for this tool and generate 5 natural example prompts. Return only the prompts, one per line."
+                    "content": "Reflect on realistic use cases for this tool and generate 5 natural example prompts. Return JSON: {\"prompts\": [...5 strings...]}"
                 },
                 {
                     "role": "user",
@@ -64,23 +209,48 @@ def _generate_example_prompts(tool_name: str, description: str) -> List[str]:
                 }
             ],
             "temperature": 0.7,
-            "max_tokens": 200
+            "max_tokens": 200,
+            "response_format": {"type": "json_object"},
+            "stream": True
         }
         
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {OPENAI_API_KEY}"
-            },
-            json=request_data,
-            timeout=10
-        )
+        # Imported lazily - asyncio alone is tens of ms at CLI startup
+        import asyncio
+        import random
+        import aiohttp
         
-        response.raise_for_status()
-        prompts = response.json()['choices'][0]['message']['content'].strip().split('\n')
+        owns_session = session is None
+        client = session or _open_openai_session()
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + PROMPT_RETRY_BUDGET
+            for attempt in range(MAX_PROMPT_ATTEMPTS):
+                try:
+                    content = await asyncio.wait_for(
+                        _stream_completion(client, request_data),
+                        deadline - loop.time()
+                    )
+                    break
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in RETRYABLE_STATUSES:
+                        raise
+                    error: Exception = e
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = e
+                    
+                # Linear backoff with jitter so concurrent inits don't retry in lockstep
+                delay = random.uniform(1, 2) * (attempt + 1)
+                if attempt == MAX_PROMPT_ATTEMPTS - 1 or loop.time() + delay >= deadline:
+                    raise error
+                await asyncio.sleep(delay)
+        finally:
+            if owns_session:
+                await client.close()
+        
+        prompts = json.loads(content)["prompts"]
         
-        if len(prompts) >= 5:
+        if len(prompts) >= 5 and all(isinstance(p, str) and p for p in prompts[:5]):
+            _store_cached_prompts(cache_key, prompts[:5])
             return prompts[:5]
             
     except Exception:
@@ -88,6 +258,44 @@ def _generate_example_prompts(tool_name: str, description: str) -> List[str]:
         
     return default_prompts
 
+def _generate_example_prompts(tool_name: str, description: str) -> List[str]:
+    """
+    Synchronous wrapper around _generate_example_prompts_async for the CLI.
+    
+    Args:
+        tool_name: Name of the tool
+        description: Tool description
+        
+    Returns:
+        List of generated example prompts
+    """
+    import asyncio
+    
+    return asyncio.run(_generate_example_prompts_async(tool_name, description))
+
+def _write_project_files(
+    proj_path: Path,
+    files: Dict[str, Union[bytes, Iterable[bytes]]]
+) -> None:
+    """
+    Write generated project files in a single pass with raw os.write calls.
+    
+    Args:
+        proj_path: Project directory (must already exist)
+        files: Mapping of file name to file contents, either as bytes or as
+            an iterable of byte chunks written as they are produced
+    """
+    for name, data in files.items():
+        chunks = (data,) if isinstance(data, bytes) else data
+        fd = os.open(proj_path / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
 def init(
     project_name: Optional[str] = typer.Argument(None, help="Name of the project to create"),
     description: Optional[str] = typer.Option(
@@ -109,7 +317,7 @@ def init(
                 project_name = typer.prompt("Enter Project Name")
         
         # Capitalize first letter
-        project_name = str(project_name)[0].upper() + str(project_name)[1:]
+        project_name = project_name[:1].upper() + project_name[1:]
         proj_path = Path(project_name)
         
         # Check if project exists
@@ -135,6 +343,7 @@ def init(
             description=description,
             example_prompts=example_prompts
         )
+        import uuid
         manifest_data["app_bundle_id"] = str(uuid.uuid4())
         
         # Create project structure
@@ -146,18 +355,19 @@ def init(
                 log.created_file(file)
             
             # Create files
-            (proj_path / "main.py").write_text(
-                generate_main_py(project_name, manifest_data)
-            )
-            (proj_path / "manifest.json").write_text(
-                json.dumps(manifest_data, indent=4, sort_keys=True, ensure_ascii=False)
-            )
-            (proj_path / "requirements.txt").write_text(
-                generate_requirements("1.0.0")
-            )
+            files: Dict[str, Union[bytes, Iterable[bytes]]] = {
+                "main.py": (
+                    chunk.encode("utf-8")
+                    for chunk in generate_main_py_iter(project_name, manifest_data)
+                ),
+                "manifest.json": json.dumps(
+                    manifest_data, indent=4, sort_keys=True, ensure_ascii=False
+                ).encode("utf-8"),
+                "requirements.txt": generate_requirements("1.0.0").encode("utf-8"),
+                "icon.png": get_default_icon_bytes(),
+            }
             
-            # Copy icon using the new utility
-            copy_default_icon(proj_path)
+            _write_project_files(proj_path, files)
             
             # Success message
             log.success("Project initialized successfully!")
@@ -19,6 +19,7 @@ from .config import (
 )
 from .templates import (
     generate_main_py,
+    generate_main_py_iter,
     generate_manifest,
     generate_requirements,
     copy_project_template,
@@ -47,6 +48,7 @@ __all__ = [
     
     # Templates
     'generate_main_py',
+    'generate_main_py_iter',
     'generate_manifest',
     'generate_requirements',
     'copy_project_template',
@@ -8,6 +8,7 @@ This module provides configuration management utilities for the Truffle CLI:
 - Provides version management utilities
 """
 
+import functools
 import json
 import re
 import tomli
@@ -22,8 +23,9 @@ from .logger import log
 DEFAULT_VERSION = "1.0.0"
 MANIFEST_VERSION = 1
 
+@functools.lru_cache(maxsize=1)
 def get_sdk_version() -> str:
-    """Get the current SDK version."""
+    """Get the current SDK version (resolved once per process)."""
     return DEFAULT_VERSION
 
 def load_manifest(manifest_path: Path) -> Dict[str, Any]:
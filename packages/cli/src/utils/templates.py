@@ -8,50 +8,73 @@ This module provides template generation utilities for Truffle projects:
 - Provides default project templates and resources
 """
 
-import shutil
 import os
+import re
+import string
 from pathlib import Path
-import importlib.resources as pkg_resources
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 from .config import get_sdk_version
-from .logger import log
 
-def generate_main_py(project_name: str, manifest: Dict[str, Any]) -> str:
-    """
-    Generate main.py content from template.
-    
-    Args:
-        project_name: Name of the project
-        manifest: Project manifest data
-        
-    Returns:
-        Generated main.py content
-    """
-    return f"""
+# File types that may contain {{ variable }} placeholders
+TEMPLATE_FILE_SUFFIXES = frozenset({".py", ".json", ".txt", ".md"})
+
+# Compiled once; main.py is produced as header, tool body and footer chunks
+MAIN_PY_TEMPLATES = (
+    string.Template('''
 import truffle
 
-class {project_name}:
+class $name:
     def __init__(self):
         self.client = truffle.TruffleClient()
     
-    # All tool calls must start with a capital letter! 
+'''),
+    string.Template('''    # All tool calls must start with a capital letter! 
     @truffle.tool(
         description="Replace this with a description of the tool.",
         icon="brain"
     )
     @truffle.args(user_input="A description of the argument")
-    def {project_name}Tool(self, user_input: str) -> str:
-        \"\"\"
+    def ${name}Tool(self, user_input: str) -> str:
+        """
         Replace this text with a basic description of what this function does.
-        \"\"\"
+        """
         # Implement your tool logic here
         pass
 
-if __name__ == "__main__":
-    app = truffle.TruffleApp({project_name}())
+'''),
+    string.Template('''if __name__ == "__main__":
+    app = truffle.TruffleApp($name())
     app.launch()
-"""
+'''),
+)
+
+def generate_main_py_iter(project_name: str, manifest: Dict[str, Any]) -> Iterator[str]:
+    """
+    Generate main.py content from template, one chunk at a time.
+    
+    Args:
+        project_name: Name of the project
+        manifest: Project manifest data
+        
+    Yields:
+        Successive chunks of main.py content
+    """
+    for template in MAIN_PY_TEMPLATES:
+        yield template.substitute(name=project_name)
+
+def generate_main_py(project_name: str, manifest: Dict[str, Any]) -> str:
+    """
+    Generate main.py content from template.
+    
+    Args:
+        project_name: Name of the project
+        manifest: Project manifest data
+        
+    Returns:
+        Generated main.py content
+    """
+    return "".join(generate_main_py_iter(project_name, manifest))
 
 def generate_manifest(
     name: str,
@@ -120,35 +143,43 @@ def copy_project_template(
         raise FileNotFoundError(f"Template not found: {template_name}")
         
     # Copy template files
+    import shutil
     shutil.copytree(template_path, target_path)
     
-    # Update files with variables
-    for file in target_path.rglob("*"):
-        if file.is_file() and file.suffix in [".py", ".json", ".txt", ".md"]:
-            content = file.read_text()
-            for key, value in variables.items():
-                content = content.replace(f"{{{{ {key} }}}}", str(value))
-            file.write_text(content)
+    if not variables:
+        return
+        
+    # Substitute every {{ key }} placeholder in a single regex pass per file
+    pattern = re.compile(
+        r"\{\{ (" + "|".join(re.escape(key) for key in variables) + r") \}\}"
+    )
+    replacements = {key: str(value) for key, value in variables.items()}
+    
+    # Update files with variables, skipping files without any placeholder
+    for root, _, file_names in os.walk(target_path):
+        for file_name in file_names:
+            if os.path.splitext(file_name)[1] not in TEMPLATE_FILE_SUFFIXES:
+                continue
+            file = Path(root) / file_name
+            raw = file.read_bytes()
+            if b"{{" not in raw:
+                continue
+            content = raw.decode("utf-8")
+            file.write_bytes(
+                pattern.sub(lambda m: replacements[m.group(1)], content).encode("utf-8")
+            )
 
-def get_default_icon_path() -> Path:
+def get_default_icon_bytes() -> bytes:
     """
-    Get the path to the default app icon using package resources.
+    Get the contents of the default app icon.
+    The icon is baked into a generated module at build time, so no package
+    resource lookup or file read is needed.
     
     Returns:
-        Path to the default icon
-        
-    Raises:
-        FileNotFoundError: If icon cannot be found in package
+        Raw PNG bytes of the default icon
     """
-    try:
-        # Get the package's installed location
-        import packages.cli.src.assets as assets
-        with pkg_resources.path(assets, 'default_app.png') as icon_path:
-            return Path(icon_path)
-    except Exception as e:
-        raise FileNotFoundError(
-            "Oops! Couldn't find the default icon. Try initializing your project again! 🎨"
-        )
+    from ..assets._icon_data import ICON_BYTES
+    return ICON_BYTES
 
 def copy_default_icon(target_path: Path) -> None:
     """
@@ -157,8 +188,4 @@ def copy_default_icon(target_path: Path) -> None:
     Args:
         target_path: Path to copy icon to
     """
-    try:
-        icon_src = get_default_icon_path()
-        shutil.copy(icon_src, target_path / "icon.png")
-    except FileNotFoundError as e:
-        log.warning("Using an empty icon since we couldn't find the default one!")
+    (target_path / "icon.png").write_bytes(get_default_icon_bytes())
@@ -10,12 +10,90 @@ This module provides core validation utilities for the Truffle CLI:
 
 import ast
 import json
+import os
 import re
+import types
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Set
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 
 from .logger import log
 
+_json_impl: types.ModuleType
+try:
+    import orjson as _json_impl
+except ImportError:  # orjson is an optional speedup
+    _json_impl = json
+
+REQUIRED_PROJECT_FILES = (
+    "main.py",
+    "manifest.json",
+    "requirements.txt",
+    "icon.png"
+)
+
+# Requirement lines are matched across the whole file at once (MULTILINE)
+_TRUFFLE_REQUIREMENT_RE = re.compile(r"^[ \t]*truffle", re.MULTILINE)
+_TRUFFLE_VERSION_RE = re.compile(
+    r"^[ \t]*truffle[ \t]*(?:[><=!~]=|[><])[ \t]*[\d\.]+",
+    re.MULTILINE
+)
+
+def _read_small(path: Path, size_hint: Optional[int] = None) -> bytes:
+    """
+    Read a small project file with a single sized read.
+    
+    Args:
+        path: Path to the file
+        size_hint: Known file size in bytes, saves an fstat when given
+        
+    Returns:
+        Raw file contents
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size_hint is None:
+            size_hint = os.fstat(fd).st_size
+        data = os.read(fd, size_hint + 1)
+        if len(data) > size_hint:
+            # File grew since it was sized - read the remainder
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+# Parsed main.py trees keyed on (path, source bytes), oldest evicted first
+_AST_CACHE: Dict[Tuple[str, bytes], ast.Module] = {}
+_AST_CACHE_SIZE = 128
+
+def _parsed_ast(raw: bytes, path_str: str) -> ast.Module:
+    """
+    Parse Python source that has already been read, memoized on its contents.
+    
+    Keying on the bytes themselves means an edited file is always re-parsed,
+    while repeated validations of an unchanged file share one AST.
+    
+    Args:
+        raw: Source bytes read from the file
+        path_str: Path to the source file
+        
+    Returns:
+        Parsed module AST
+    """
+    key = (path_str, raw)
+    tree = _AST_CACHE.get(key)
+    if tree is None:
+        tree = ast.parse(raw, filename=path_str)
+        if len(_AST_CACHE) >= _AST_CACHE_SIZE:
+            del _AST_CACHE[next(iter(_AST_CACHE))]
+        _AST_CACHE[key] = tree
+    return tree
+
 def validate_project_structure(project_path: Path) -> bool:
     """
     Validate the basic structure of a Truffle project.
@@ -40,24 +118,21 @@ def validate_project_structure(project_path: Path) -> bool:
             })
             return False
             
-        # Check required files
-        required_files = [
-            "main.py",
-            "manifest.json",
-            "requirements.txt",
-            "icon.png"
-        ]
+        # Check required files against a single directory listing
+        with os.scandir(project_path) as it:
+            entries = {entry.name: entry for entry in it}
         
-        for file in required_files:
+        for file in REQUIRED_PROJECT_FILES:
             file_path = project_path / file
-            if not file_path.exists():
+            entry = entries.get(file)
+            if entry is None:
                 log.error(f"Looks like {file} is missing! Your project might be corrupted - try initializing it again.", {
                     "file": file,
                     "path": str(file_path)
                 })
                 return False
                 
-            if not file_path.is_file():
+            if not entry.is_file():
                 log.error(f"There's something wrong with {file}. Try initializing your project again!", {
                     "file": file,
                     "path": str(file_path)
@@ -84,7 +159,7 @@ def validate_manifest_json(manifest_path: Path) -> bool:
     """
     try:
         # Load and parse JSON
-        manifest = json.loads(manifest_path.read_text())
+        manifest = _json_impl.loads(_read_small(manifest_path))
         
         # Check required fields
         required_fields = {
@@ -147,27 +222,28 @@ def validate_main_py(main_py_path: Path) -> bool:
         True if valid, False otherwise
     """
     try:
-        content = main_py_path.read_text()
+        raw = _read_small(main_py_path)
         
-        # Check basic imports
-        if "import truffle" not in content:
+        # Cheap byte scans first so obviously incomplete files skip the parse.
+        # Tools are only looked for in the AST: '@truffle .tool' and line
+        # continuations are valid decorators that a byte scan would miss.
+        if b"import truffle" not in raw:
             log.error("Don't forget to import truffle in your main.py!")
             return False
             
-        if ".launch()" not in content:
+        if b".launch()" not in raw:
             log.error("Your main.py needs to call .launch() to start your tool!")
             return False
             
         # Parse and validate AST
-        tree = ast.parse(content)
-        visitor = ToolVisitor()
-        visitor.visit(tree)
+        tree = _parsed_ast(raw, str(main_py_path))
+        has_tool_method, has_launch_call = scan_tools(tree)
         
-        if not visitor.has_tool_method:
+        if not has_tool_method:
             log.error("Looks like you haven't created your tool yet! Add a function with @truffle.tool decorator.")
             return False
             
-        if not visitor.has_launch_call:
+        if not has_launch_call:
             log.error("Don't forget to launch your app with app.launch()!")
             return False
             
@@ -184,67 +260,80 @@ def validate_main_py(main_py_path: Path) -> bool:
         })
         return False
 
-class ToolVisitor(ast.NodeVisitor):
-    """AST visitor for validating Truffle tool structure."""
-    
-    def __init__(self):
-        self.has_tool_method = False
-        self.has_launch_call = False
-        self.tool_methods: Set[str] = set()
+def _check_truffle_decorator(decorator: ast.expr, attr_name: str) -> bool:
+    """Check if a decorator is a truffle.{attr_name} decorator."""
+    # ast node classes are never subclassed, so exact type checks are safe
+    if type(decorator) is ast.Call:
+        # Handle @truffle.tool() or @truffle.args() with arguments
+        func = decorator.func
+        return (
+            type(func) is ast.Attribute
+            and type(func.value) is ast.Name
+            and func.value.id == "truffle"
+            and func.attr == attr_name
+        )
+    if type(decorator) is ast.Attribute:
+        # Handle @truffle.tool or @truffle.args without arguments
+        return (
+            type(decorator.value) is ast.Name
+            and decorator.value.id == "truffle"
+            and decorator.attr == attr_name
+        )
+    return False
 
-    def _check_truffle_decorator(self, decorator: ast.AST, attr_name: str) -> bool:
-        """Check if a decorator is a truffle.{attr_name} decorator."""
-        if isinstance(decorator, ast.Call):
-            # Handle @truffle.tool() or @truffle.args() with arguments
-            return (
-                isinstance(decorator.func, ast.Attribute)
-                and isinstance(decorator.func.value, ast.Name)
-                and decorator.func.value.id == "truffle"
-                and decorator.func.attr == attr_name
-            )
-        elif isinstance(decorator, ast.Attribute):
-            # Handle @truffle.tool or @truffle.args without arguments
-            return (
-                isinstance(decorator.value, ast.Name)
-                and decorator.value.id == "truffle"
-                and decorator.attr == attr_name
-            )
-        return False
+def _has_tool_decorator(decorators: Sequence[ast.expr]) -> bool:
+    """Check that a function/method has the required truffle decorators."""
+    # args decorator is optional
+    return any(_check_truffle_decorator(decorator, "tool") for decorator in decorators)
 
-    def _validate_tool_decorators(self, decorators: List[ast.AST]) -> bool:
-        """Validate that a function/method has the required truffle decorators."""
-        has_tool = False
-        has_args = False
+def scan_tools(tree: ast.AST) -> Tuple[bool, bool]:
+    """
+    Scan a module AST for Truffle tool structure in a single pass.
+    Stops walking as soon as both a tool method and a launch call are found.
+    
+    Only tools defined at module level or directly in a class body count, and
+    only a .launch() call used as a statement outside function and class
+    bodies counts. Other compound statements (if, with, try, ...) are entered.
+    
+    Args:
+        tree: Parsed module AST
         
-        for decorator in decorators:
-            if self._check_truffle_decorator(decorator, "tool"):
-                has_tool = True
-            elif self._check_truffle_decorator(decorator, "args"):
-                has_args = True
-                
-        return has_tool  # args decorator is optional
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
-        if self._validate_tool_decorators(node.decorator_list):
-            self.has_tool_method = True
-            self.tool_methods.add(node.name)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition."""
-        # Visit class body for methods
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                if self._validate_tool_decorators(item.decorator_list):
-                    self.has_tool_method = True
-                    self.tool_methods.add(item.name)
-                            
-    def visit_Expr(self, node: ast.Expr) -> None:
-        """Visit expression."""
-        if isinstance(node.value, ast.Call):
-            if isinstance(node.value.func, ast.Attribute):
-                if node.value.func.attr == "launch":
-                    self.has_launch_call = True
+    Returns:
+        Tuple of (has_tool_method, has_launch_call)
+    """
+    has_tool_method = False
+    has_launch_call = False
+    
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if type(node) is ast.FunctionDef:
+            # Function bodies are not entered
+            if not has_tool_method and _has_tool_decorator(node.decorator_list):
+                has_tool_method = True
+        elif type(node) is ast.ClassDef:
+            # Only direct methods count; nested bodies are not entered
+            if not has_tool_method:
+                has_tool_method = any(
+                    type(item) is ast.FunctionDef and _has_tool_decorator(item.decorator_list)
+                    for item in node.body
+                )
+        elif type(node) is ast.Expr:
+            value = node.value
+            if (
+                type(value) is ast.Call
+                and type(value.func) is ast.Attribute
+                and value.func.attr == "launch"
+            ):
+                has_launch_call = True
+        else:
+            stack.extend(ast.iter_child_nodes(node))
+            continue
+            
+        if has_tool_method and has_launch_call:
+            break
+            
+    return has_tool_method, has_launch_call
 
 def validate_requirements_txt(requirements_path: Path) -> bool:
     """
@@ -258,21 +347,16 @@ def validate_requirements_txt(requirements_path: Path) -> bool:
         True if valid, False otherwise
     """
     try:
-        content = requirements_path.read_text()
-        lines = [line.strip() for line in content.splitlines()]
-        package_lines = [line for line in lines if line and not line.startswith("#")]
+        content = _read_small(requirements_path).decode("utf-8")
         
         # Check for truffle package
-        truffle_lines = [line for line in package_lines if line.startswith("truffle")]
-        if not truffle_lines:
+        if not _TRUFFLE_REQUIREMENT_RE.search(content):
             log.error("truffle package not found")
             return False
             
         # Check version specification
-        version_pattern = r"truffle\s*(?:[><=!~]=|[><])\s*[\d\.]+"
-        for line in truffle_lines:
-            if re.match(version_pattern, line):
-                return True
+        if _TRUFFLE_VERSION_RE.search(content):
+            return True
                 
         log.error("truffle package version not specified")
         return False
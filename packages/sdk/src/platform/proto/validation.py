@@ -13,6 +13,41 @@ from ...types.models import TruffleReturnType, ToolMetadata, AppMetadata
 from .. import sdk_pb2
 from ...client.exceptions import ValidationError
 
+VALID_PROTO_TYPES = frozenset((
+    sdk_pb2.TruffleType.TRUFFLE_FILE,
+    sdk_pb2.TruffleType.TRUFFLE_IMAGE,
+    sdk_pb2.TruffleType.TRUFFLE_UNSPECIFIED,
+))
+
+# Fixed error messages, shared by the validators below. Only the strings are
+# shared: a reused exception instance would keep its __traceback__ (and the
+# frames it references) and __context__ between raises, so each raise still
+# builds a fresh ValidationError.
+_ERR_CONTENT_EMPTY = "Content message cannot be empty"
+_ERR_TOOL_NAME_EMPTY = "Tool name cannot be empty"
+_ERR_TOOL_DESCRIPTION_EMPTY = "Tool description cannot be empty"
+_ERR_TOOL_RESPONSE_EMPTY = "ToolResponse must have either response or error"
+_ERR_APP_FULLNAME_EMPTY = "App fullname cannot be empty"
+_ERR_APP_NAME_EMPTY = "App name cannot be empty"
+_ERR_APP_DESCRIPTION_EMPTY = "App description cannot be empty"
+_ERR_APP_GOAL_EMPTY = "App goal cannot be empty"
+_ERR_MODEL_ID_NEGATIVE = "Model ID cannot be negative"
+_ERR_MAX_TOKENS_NOT_POSITIVE = "Max tokens must be positive"
+_ERR_TEMPERATURE_RANGE = "Temperature must be between 0 and 1"
+_ERR_ERROR_AND_TOKEN = "Response cannot have both error and token"
+_ERR_FINISH_REASON_WITHOUT_ERROR = "Error finish reason must have error message"
+
+FINISH_REASON_ERROR = sdk_pb2.GenerateFinishReason.FINISH_REASON_ERROR
+
+VALID_CONTENT_ROLES = frozenset(("system", "user", "ai"))
+
+VALID_PROTO_CONTENT_ROLES = frozenset((
+    sdk_pb2.Content.ROLE_SYSTEM,
+    sdk_pb2.Content.ROLE_USER,
+    sdk_pb2.Content.ROLE_AI,
+    sdk_pb2.Content.ROLE_INVALID,
+))
+
 def validate_truffle_type(obj: typing.Any) -> None:
     """Validate that an object is a valid Truffle type."""
     if not isinstance(obj, TruffleReturnType):
@@ -20,75 +55,80 @@ def validate_truffle_type(obj: typing.Any) -> None:
 
 def validate_proto_type(type_enum: sdk_pb2.TruffleType) -> None:
     """Validate that a proto type enum is valid."""
-    valid_types = [
-        sdk_pb2.TruffleType.TRUFFLE_TYPE_FILE,
-        sdk_pb2.TruffleType.TRUFFLE_TYPE_IMAGE,
-        sdk_pb2.TruffleType.TRUFFLE_TYPE_UNSPECIFIED,
-    ]
-    if type_enum not in valid_types:
+    if type_enum not in VALID_PROTO_TYPES:
         raise ValidationError(f"Invalid TruffleType enum value: {type_enum}")
 
 def validate_content_role(role: str) -> None:
     """Validate that a content role string is valid."""
-    valid_roles = ["system", "user", "ai"]
-    if role.lower() not in valid_roles:
+    # Roles are usually already lowercase, so skip the lower() copy when possible
+    if role not in VALID_CONTENT_ROLES and role.lower() not in VALID_CONTENT_ROLES:
         raise ValidationError(f"Invalid content role: {role}")
 
 def validate_proto_content(content: sdk_pb2.Content) -> None:
     """Validate that a proto Content message is valid."""
-    valid_roles = [
-        sdk_pb2.Content.ROLE_SYSTEM,
-        sdk_pb2.Content.ROLE_USER,
-        sdk_pb2.Content.ROLE_AI,
-        sdk_pb2.Content.ROLE_INVALID,
-    ]
-    if content.role not in valid_roles:
-        raise ValidationError(f"Invalid Content role: {content.role}")
+    role = content.role
+    if role not in VALID_PROTO_CONTENT_ROLES:
+        raise ValidationError(f"Invalid Content role: {role}")
     if not content.content:
-        raise ValidationError("Content message cannot be empty")
+        raise ValidationError(_ERR_CONTENT_EMPTY)
 
+# The fixed-schema validators below are already straight-line attribute checks,
+# which is exactly what a generated validator would compile to.
 def validate_tool_metadata(tool: ToolMetadata) -> None:
     """Validate that tool metadata is valid."""
     if not tool.name:
-        raise ValidationError("Tool name cannot be empty")
+        raise ValidationError(_ERR_TOOL_NAME_EMPTY)
     if not tool.description:
-        raise ValidationError("Tool description cannot be empty")
+        raise ValidationError(_ERR_TOOL_DESCRIPTION_EMPTY)
 
 def validate_tool_request(request: sdk_pb2.ToolRequest) -> None:
     """Validate that a proto ToolRequest message is valid."""
     if not request.tool_name:
-        raise ValidationError("Tool name cannot be empty")
+        raise ValidationError(_ERR_TOOL_NAME_EMPTY)
     if not request.description:
-        raise ValidationError("Tool description cannot be empty")
+        raise ValidationError(_ERR_TOOL_DESCRIPTION_EMPTY)
 
 def validate_tool_response(response: sdk_pb2.ToolResponse) -> None:
     """Validate that a proto ToolResponse message is valid."""
     if not response.response and not response.error:
-        raise ValidationError("ToolResponse must have either response or error")
+        raise ValidationError(_ERR_TOOL_RESPONSE_EMPTY)
 
 def validate_app_metadata(metadata: AppMetadata) -> None:
     """Validate that app metadata is valid."""
     if not metadata.fullname:
-        raise ValidationError("App fullname cannot be empty")
+        raise ValidationError(_ERR_APP_FULLNAME_EMPTY)
     if not metadata.name:
-        raise ValidationError("App name cannot be empty")
+        raise ValidationError(_ERR_APP_NAME_EMPTY)
     if not metadata.description:
-        raise ValidationError("App description cannot be empty")
+        raise ValidationError(_ERR_APP_DESCRIPTION_EMPTY)
     if not metadata.goal:
-        raise ValidationError("App goal cannot be empty")
+        raise ValidationError(_ERR_APP_GOAL_EMPTY)
 
 def validate_generate_request(request: sdk_pb2.GenerateRequest) -> None:
     """Validate that a GenerateRequest message is valid."""
-    if request.model_id < 0:
-        raise ValidationError("Model ID cannot be negative")
-    if request.max_tokens <= 0:
-        raise ValidationError("Max tokens must be positive")
-    if not 0 <= request.temperature <= 1:
-        raise ValidationError("Temperature must be between 0 and 1")
+    model_id = request.model_id
+    max_tokens = request.max_tokens
+    temperature = request.temperature
+    # One combined test on the (common) valid path; the slow path is out of line
+    if (model_id < 0) | (max_tokens <= 0) | (not 0 <= temperature <= 1):
+        _raise_generate_request_error(model_id, max_tokens, temperature)
+
+def _raise_generate_request_error(
+    model_id: int,
+    max_tokens: int,
+    temperature: float,
+) -> typing.NoReturn:
+    """Raise the error for the first invalid GenerateRequest field."""
+    if model_id < 0:
+        raise ValidationError(_ERR_MODEL_ID_NEGATIVE)
+    if max_tokens <= 0:
+        raise ValidationError(_ERR_MAX_TOKENS_NOT_POSITIVE)
+    raise ValidationError(_ERR_TEMPERATURE_RANGE)
 
 def validate_generate_response(response: sdk_pb2.GenerateResponse) -> None:
     """Validate that a GenerateResponse message is valid."""
-    if response.error and response.token:
-        raise ValidationError("Response cannot have both error and token")
-    if response.finish_reason == sdk_pb2.GenerateFinishReason.FINISH_REASON_ERROR and not response.error:
-        raise ValidationError("Error finish reason must have error message") 
\ No newline at end of file
+    error = response.error
+    if error and response.token:
+        raise ValidationError(_ERR_ERROR_AND_TOKEN)
+    if not error and response.finish_reason == FINISH_REASON_ERROR:
+        raise ValidationError(_ERR_FINISH_REASON_WITHOUT_ERROR) 
\ No newline at end of file
@@ -12,13 +12,30 @@ Features:
 
 import typing
 from dataclasses import dataclass, field
-from typing import Any, Type
+from typing import Any, Callable, Type
 from google.protobuf.descriptor import (
     Descriptor,
     FieldDescriptor
 )
 from google.protobuf.message import Message
 
+from .utils import PROTO_FIELD_DEFAULTS, is_numeric_field
+
+# Python types for proto field types, built once instead of per lookup
+_FIELD_PYTHON_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: float,
+    FieldDescriptor.TYPE_FLOAT: float,
+    FieldDescriptor.TYPE_INT64: int,
+    FieldDescriptor.TYPE_UINT64: int,
+    FieldDescriptor.TYPE_INT32: int,
+    FieldDescriptor.TYPE_UINT32: int,
+    FieldDescriptor.TYPE_BOOL: bool,
+    FieldDescriptor.TYPE_STRING: str,
+    FieldDescriptor.TYPE_BYTES: bytes,
+    FieldDescriptor.TYPE_MESSAGE: Message,
+    FieldDescriptor.TYPE_ENUM: int,
+}
+
 @dataclass
 class FieldInfo:
     """Information about a protocol buffer field."""
@@ -30,6 +47,7 @@ class FieldInfo:
     message_type: typing.Optional[Type[Message]] = None
     enum_type: typing.Optional[Type] = None
     options: typing.Dict[str, Any] = field(default_factory=dict)
+    is_numeric: bool = False
 
 class DescriptorToMessageClass:
     """Converts protocol buffer descriptors to Python message classes."""
@@ -38,10 +56,12 @@ class DescriptorToMessageClass:
         """Initialize the converter."""
         self.type_registry: typing.Dict[str, Type] = {}
         self.enum_registry: typing.Dict[str, Type] = {}
+        self.class_cache: typing.Dict[Descriptor, Type[Message]] = {}
         
     def convert(self, desc: Descriptor) -> Type[Message]:
         """
         Convert descriptor to message class.
+        Classes are generated once per descriptor and reused on later calls.
         
         Args:
             desc: Message descriptor to convert
@@ -52,6 +72,10 @@ class DescriptorToMessageClass:
         Raises:
             ValueError: If conversion fails
         """
+        cached = self.class_cache.get(desc)
+        if cached is not None:
+            return cached
+            
         # Clear registries
         self.type_registry.clear()
         self.enum_registry.clear()
@@ -60,7 +84,9 @@ class DescriptorToMessageClass:
         self._process_nested_types(desc)
         
         # Create class
-        return self._create_message_class(desc)
+        message_class = self._create_message_class(desc)
+        self.class_cache[desc] = message_class
+        return message_class
         
     def _process_nested_types(self, desc: Descriptor) -> None:
         """
@@ -177,7 +203,8 @@ class DescriptorToMessageClass:
                 desc.enum_type if desc.type == FieldDescriptor.TYPE_ENUM
                 else None
             ),
-            options=dict(desc.options.ListFields()) if desc.options else {}
+            options=dict(desc.options.ListFields()) if desc.options else {},
+            is_numeric=is_numeric_field(desc)
         )
         
     def _create_field_property(
@@ -195,85 +222,122 @@ class DescriptorToMessageClass:
         Returns:
             Property descriptor
         """
+        attr = f'_{name}'
+        default = info.default
+        validate = self._make_validator(info)
+        is_repeated = info.label == FieldDescriptor.LABEL_REPEATED
+        # Numeric lists convert with a single C-level map() over the Python type
+        convert_many = info.type if is_repeated and info.is_numeric else None
+        
         def getter(msg):
-            if not hasattr(msg, f'_{name}'):
-                setattr(msg, f'_{name}', info.default)
-            return getattr(msg, f'_{name}')
+            if not hasattr(msg, attr):
+                setattr(msg, attr, default)
+            return getattr(msg, attr)
             
         def setter(msg, value):
             # Validate type
-            if info.label == FieldDescriptor.LABEL_REPEATED:
+            if is_repeated:
                 if not isinstance(value, (list, tuple)):
                     raise TypeError(f"Field {name} must be a list")
-                value = [self._validate_value(v, info) for v in value]
+                if convert_many is not None:
+                    try:
+                        value = list(map(convert_many, value))
+                    except (TypeError, ValueError):
+                        # Re-validate item by item for the detailed error
+                        value = [validate(v) for v in value]
+                else:
+                    value = [validate(v) for v in value]
             else:
-                value = self._validate_value(value, info)
+                value = validate(value)
                 
-            setattr(msg, f'_{name}', value)
+            setattr(msg, attr, value)
             
         def deleter(msg):
-            if hasattr(msg, f'_{name}'):
-                delattr(msg, f'_{name}')
+            if hasattr(msg, attr):
+                delattr(msg, attr)
                 
         return property(getter, setter, deleter)
         
-    def _validate_value(self, value: Any, info: FieldInfo) -> Any:
+    def _make_validator(self, info: FieldInfo) -> Callable[[Any], Any]:
         """
-        Validate and convert a field value.
+        Build a validator specialized for a single field.
+        
+        Type dispatch and field info lookups are resolved once here, so each
+        assignment only runs the checks relevant to the field's kind.
         
         Args:
-            value: Value to validate
             info: Field info
             
         Returns:
-            Validated value
-            
-        Raises:
-            TypeError: If value has invalid type
-            ValueError: If value is invalid
+            Function that validates and converts a value for the field,
+            raising TypeError on an invalid type and ValueError on an
+            invalid value
         """
-        if value is None:
+        name = info.name
+        field_type = info.type
+        
+        def missing() -> Any:
             if info.label == FieldDescriptor.LABEL_REQUIRED:
-                raise ValueError(f"Field {info.name} is required")
+                raise ValueError(f"Field {name} is required")
             return info.default
             
         # Handle message types
         if info.message_type is not None:
-            if not isinstance(value, (dict, info.type)):
-                raise TypeError(
-                    f"Field {info.name} must be a {info.type.__name__} or dict"
-                )
-            if isinstance(value, dict):
-                msg = info.type()
-                for k, v in value.items():
-                    setattr(msg, k, v)
-                return msg
-            return value
+            def validate_message(value: Any) -> Any:
+                if value is None:
+                    return missing()
+                if not isinstance(value, (dict, field_type)):
+                    raise TypeError(
+                        f"Field {name} must be a {field_type.__name__} or dict"
+                    )
+                if isinstance(value, dict):
+                    msg = field_type()
+                    for k, v in value.items():
+                        setattr(msg, k, v)
+                    return msg
+                return value
+            return validate_message
             
         # Handle enum types
         if info.enum_type is not None:
-            if isinstance(value, str):
-                if not hasattr(info.type, value):
+            # Membership sets are O(1), unlike scanning _values_.values()
+            enum_values = getattr(field_type, '_values_', {})
+            valid_names = frozenset(enum_values)
+            valid_numbers = frozenset(enum_values.values())
+            
+            def validate_enum(value: Any) -> Any:
+                if value is None:
+                    return missing()
+                if isinstance(value, str):
+                    if value not in valid_names:
+                        raise ValueError(
+                            f"Invalid enum value '{value}' for field {name}"
+                        )
+                    return enum_values[value]
+                if not isinstance(value, int):
+                    raise TypeError(f"Field {name} must be an integer or string")
+                if value not in valid_numbers:
                     raise ValueError(
-                        f"Invalid enum value '{value}' for field {info.name}"
+                        f"Invalid enum value {value} for field {name}"
                     )
-                return getattr(info.type, value)
-            if not isinstance(value, int):
-                raise TypeError(f"Field {info.name} must be an integer or string")
-            if value not in info.type._values_.values():
-                raise ValueError(
-                    f"Invalid enum value {value} for field {info.name}"
-                )
-            return value
+                return value
+            return validate_enum
             
         # Handle basic types
-        try:
-            return info.type(value)
-        except (TypeError, ValueError) as e:
-            raise TypeError(
-                f"Cannot convert value '{value}' to {info.type.__name__} "
-                f"for field {info.name}: {e}"
-            ) 
+        def validate_scalar(value: Any) -> Any:
+            # Already the exact target type - no conversion (or copy) needed
+            if type(value) is field_type:
+                return value
+            if value is None:
+                return missing()
+            try:
+                return field_type(value)
+            except (TypeError, ValueError) as e:
+                raise TypeError(
+                    f"Cannot convert value '{value}' to {field_type.__name__} "
+                    f"for field {name}: {e}"
+                )
+        return validate_scalar
             
     def _get_python_type(self, field_type: int) -> Type:
         """
@@ -288,22 +352,10 @@ class DescriptorToMessageClass:
         Raises:
             ValueError: If field type is invalid
         """
-        type_map = {
-            FieldDescriptor.TYPE_DOUBLE: float,
-            FieldDescriptor.TYPE_FLOAT: float,
-            FieldDescriptor.TYPE_INT64: int,
-            FieldDescriptor.TYPE_UINT64: int,
-            FieldDescriptor.TYPE_INT32: int,
-            FieldDescriptor.TYPE_UINT32: int,
-            FieldDescriptor.TYPE_BOOL: bool,
-            FieldDescriptor.TYPE_STRING: str,
-            FieldDescriptor.TYPE_BYTES: bytes,
-            FieldDescriptor.TYPE_MESSAGE: Message,
-            FieldDescriptor.TYPE_ENUM: int,
-        }
-        if field_type not in type_map:
+        python_type = _FIELD_PYTHON_TYPES.get(field_type)
+        if python_type is None:
             raise ValueError(f"Unsupported field type: {field_type}")
-        return type_map[field_type]
+        return python_type
         
     def _get_field_default(self, field_type: int) -> Any:
         """
@@ -315,26 +367,4 @@ class DescriptorToMessageClass:
         Returns:
             Default value
         """
-        if field_type in {
-            FieldDescriptor.TYPE_DOUBLE,
-            FieldDescriptor.TYPE_FLOAT,
-            FieldDescriptor.TYPE_INT64,
-            FieldDescriptor.TYPE_UINT64,
-            FieldDescriptor.TYPE_INT32,
-            FieldDescriptor.TYPE_UINT32,
-        }:
-            return 0
-            
-        if field_type == FieldDescriptor.TYPE_BOOL:
-            return False
-            
-        if field_type == FieldDescriptor.TYPE_STRING:
-            return ""
-            
-        if field_type == FieldDescriptor.TYPE_BYTES:
-            return b""
-            
-        if field_type == FieldDescriptor.TYPE_ENUM:
-            return 0
-            
-        return None 
\ No newline at end of file
+        return PROTO_FIELD_DEFAULTS.get(field_type)
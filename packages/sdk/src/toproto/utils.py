@@ -13,7 +13,8 @@ import re
 from typing import Any, List, Type
 from google.protobuf.descriptor import (
     Descriptor,
-    FieldDescriptor
+    FieldDescriptor,
+    FileDescriptor
 )
 
 # Type mapping from Python to Proto
@@ -40,6 +41,20 @@ PROTO_TO_PYTHON_TYPES = {
     FieldDescriptor.TYPE_ENUM: int,
 }
 
+# Default values for proto field types (message fields default to None)
+PROTO_FIELD_DEFAULTS = {
+    FieldDescriptor.TYPE_DOUBLE: 0,
+    FieldDescriptor.TYPE_FLOAT: 0,
+    FieldDescriptor.TYPE_INT64: 0,
+    FieldDescriptor.TYPE_UINT64: 0,
+    FieldDescriptor.TYPE_INT32: 0,
+    FieldDescriptor.TYPE_UINT32: 0,
+    FieldDescriptor.TYPE_BOOL: False,
+    FieldDescriptor.TYPE_STRING: "",
+    FieldDescriptor.TYPE_BYTES: b"",
+    FieldDescriptor.TYPE_ENUM: 0,
+}
+
 def snake_to_camel(name: str) -> str:
     """Convert snake_case to camelCase."""
     components = name.split('_')
@@ -89,36 +104,36 @@ def get_field_type(python_type: Type) -> int:
 
 def get_python_type(field_type: int) -> Type:
     """Get Python type for protocol buffer field type."""
-    if field_type in PROTO_TO_PYTHON_TYPES:
-        return PROTO_TO_PYTHON_TYPES[field_type]
-        
-    raise ValueError(f"Cannot map proto type {field_type} to Python type")
+    python_type = PROTO_TO_PYTHON_TYPES.get(field_type)
+    if python_type is None:
+        raise ValueError(f"Cannot map proto type {field_type} to Python type")
+    return python_type
 
 def get_field_default(field_type: int) -> Any:
     """Get default value for protocol buffer field type."""
-    if field_type in {
-        FieldDescriptor.TYPE_DOUBLE,
-        FieldDescriptor.TYPE_FLOAT,
-        FieldDescriptor.TYPE_INT64,
-        FieldDescriptor.TYPE_UINT64,
-        FieldDescriptor.TYPE_INT32,
-        FieldDescriptor.TYPE_UINT32,
-    }:
-        return 0
-        
-    if field_type == FieldDescriptor.TYPE_BOOL:
-        return False
-        
-    if field_type == FieldDescriptor.TYPE_STRING:
-        return ""
-        
-    if field_type == FieldDescriptor.TYPE_BYTES:
-        return b""
-        
-    if field_type == FieldDescriptor.TYPE_ENUM:
-        return 0
-        
-    return None
+    return PROTO_FIELD_DEFAULTS.get(field_type)
+
+NUMERIC_FIELD_TYPES = frozenset({
+    FieldDescriptor.TYPE_DOUBLE,
+    FieldDescriptor.TYPE_FLOAT,
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_INT32,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_FIXED32,
+    FieldDescriptor.TYPE_UINT32,
+    FieldDescriptor.TYPE_SFIXED32,
+    FieldDescriptor.TYPE_SFIXED64,
+    FieldDescriptor.TYPE_SINT32,
+    FieldDescriptor.TYPE_SINT64,
+})
+
+# Field type numbers are small ints (1..18), so membership is a single bit test
+_NUMERIC_MASK = sum(1 << t for t in NUMERIC_FIELD_TYPES)
+
+def is_numeric_field(field: FieldDescriptor) -> bool:
+    """Check if a field holds integer or floating point values."""
+    return (1 << field.type) & _NUMERIC_MASK != 0
 
 def is_message_type(python_type: Type) -> bool:
     """Check if a Python type represents a protocol buffer message."""
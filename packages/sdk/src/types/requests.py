@@ -12,12 +12,33 @@ Features:
 - EmbedRequest: Text embedding generation
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+import sys
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Union
 
 from ..tools.utils import validate_tool_args
 
-@dataclass
+# Requests are created per RPC, so use __slots__ instead of a per-instance
+# __dict__ where the interpreter supports it (dataclass slots need 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def set_metadata_item(request: Any, key: str, value: Any) -> None:
+    """
+    Set a metadata entry on a request, creating the dict on first write.
+
+    Request metadata defaults to None so requests that never carry any
+    don't pay for an empty dict.
+
+    Args:
+        request: Request instance with a ``metadata`` field
+        key: Metadata key
+        value: Metadata value
+    """
+    if request.metadata is None:
+        request.metadata = {}
+    request.metadata[key] = value
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GenerateRequest:
     """Request for model generation."""
     prompt: str
@@ -27,7 +48,7 @@ class GenerateRequest:
     top_p: float = 1.0
     stop: Optional[List[str]] = None
     stream: bool = False
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
     def validate(self) -> None:
         """Validate request parameters."""
@@ -42,7 +63,7 @@ class GenerateRequest:
         if not 0 <= self.top_p <= 1:
             raise ValueError("top_p must be between 0 and 1")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GetModelsRequest:
     """Request to get available models."""
     include_hidden: bool = False
@@ -51,25 +72,31 @@ class GetModelsRequest:
         """Validate request parameters."""
         pass  # No validation needed
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemToolRequest:
     """Request for system tool operations."""
     tool_name: str
     args: Dict[str, Any]
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
-    def validate(self) -> None:
+    def validate(self, _validate_tool_args=validate_tool_args) -> None:
         """Validate request parameters."""
-        if not self.tool_name:
+        # Default-arg binding makes the helper a fast local on every tool call
+        tool_name = self.tool_name
+        if not tool_name:
             raise ValueError("Tool name cannot be empty")
-        validate_tool_args(self.tool_name, self.args)
+        _validate_tool_args(tool_name, self.args)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ToolUpdateRequest:
     """Request to update tool status."""
+    _VALID_STATUSES: ClassVar[FrozenSet[str]] = frozenset(
+        ("started", "completed", "failed", "cancelled")
+    )
+    
     tool_name: str
     status: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
     def validate(self) -> None:
         """Validate request parameters."""
@@ -77,16 +104,16 @@ class ToolUpdateRequest:
             raise ValueError("Tool name cannot be empty")
         if not self.status:
             raise ValueError("Status cannot be empty")
-        if self.status not in {"started", "completed", "failed", "cancelled"}:
+        if self.status not in self._VALID_STATUSES:
             raise ValueError("Invalid status")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class UserRequest:
     """Request for user interaction."""
     prompt: str
     options: Optional[List[str]] = None
     timeout: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
     def validate(self) -> None:
         """Validate request parameters."""
@@ -95,24 +122,34 @@ class UserRequest:
         if self.timeout is not None and self.timeout <= 0:
             raise ValueError("Timeout must be positive")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EmbedRequest:
     """Request for text embedding."""
     text: Union[str, List[str]]
     model: str = "text-embedding-ada-002"
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
 
     def validate(self) -> None:
         """Validate request parameters."""
-        if isinstance(self.text, str):
-            if not self.text:
+        text = self.text
+        text_type = type(text)
+        if text_type is not str and text_type is not list:
+            # Exact types are the fast path; subclasses fall back to isinstance
+            if isinstance(text, str):
+                text_type = str
+            elif isinstance(text, list):
+                text_type = list
+            else:
+                raise TypeError("Text must be string or list of strings")
+        if text_type is str:
+            if not text:
                 raise ValueError("Text cannot be empty")
-        elif isinstance(self.text, list):
-            if not self.text:
-                raise ValueError("Text list cannot be empty")
-            if not all(isinstance(t, str) and t for t in self.text):
-                raise ValueError("All texts must be non-empty strings")
         else:
-            raise TypeError("Text must be string or list of strings")
+            if not text:
+                raise ValueError("Text list cannot be empty")
+            for i, t in enumerate(text):
+                # Exact type check first so plain str items skip the isinstance MRO walk
+                if (type(t) is not str and not isinstance(t, str)) or not t:
+                    raise ValueError(f"All texts must be non-empty strings (text[{i}] is not)")
         if not self.model:
             raise ValueError("Model must be specified")
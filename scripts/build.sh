@@ -31,6 +31,10 @@ OPENAI_API_KEY = None
 EOL
 fi
 
+# Bake the default app icon into the CLI package
+echo "Generating icon data..."
+python3 ./packages/cli/scripts/generate_icon_data.py
+
 # Generate protobuf files
 echo "Generating protobuf files..."
 python3 -m grpc_tools.protoc -I./protos --python_out=./packages/sdk/src/platform --grpc_python_out=./packages/sdk/src/platform ./protos/*.proto